@@ -11,6 +11,12 @@ from datetime import datetime
 import json
 import logging
 import sys
+import io
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 
 LOG_FILE = "daily_scrape.log"
@@ -38,6 +44,10 @@ RANKING_JSON_URL = "https://data.basil-ladder.net/stats/ranking.json"
 TEST_MODE = False
 MAX_GAMES_TO_SCRAPE = 10
 
+QUERY_SERVER_HOST = "127.0.0.1"
+QUERY_SERVER_PORT = 8765
+QUERY_CACHE_MAX_ENTRIES = 1024
+
 
 # Create empty DataFrame with required columns
 def create_empty_dataframe():
@@ -97,14 +107,22 @@ def get_all_bot_ratings():
         return {}
 
 
-def extract_basil_ladder_games(bot_ratings_dict):
-    logging.info("Fetching latest games from BASIL Ladder (Last 24h)...")
+def start_chrome_driver():
+    logging.info("Starting headless Chrome...")
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
 
-    driver = webdriver.Chrome(options=chrome_options)
+    return webdriver.Chrome(options=chrome_options)
+
+
+# Scrapes the "Last 24h" table. An already started driver can be passed in,
+# it is closed once scraping is done either way.
+def extract_basil_ladder_games(bot_ratings_dict, driver=None):
+    logging.info("Fetching latest games from BASIL Ladder (Last 24h)...")
+    if driver is None:
+        driver = start_chrome_driver()
     games_data = []
 
     try:
@@ -388,6 +406,92 @@ def _parse_game_length(game_length):
     return total
 
 
+# Aggregate database statistics into a dict, shared by show_statistics and the query server
+def compute_statistics(games_df):
+    total_games = len(games_df)
+    stats = {"total_games": total_games}
+
+    stats["replays"] = {
+        "downloaded": int((games_df['downloaded'] == True).sum()),
+        "pending_download": int((games_df['replay_link'].notna() & (games_df['downloaded'] == False)).sum()),
+        "missing_link": int(games_df['replay_link'].isna().sum()),
+    }
+
+    map_counts = games_df['map_name'].dropna().value_counts()
+    stats["top_maps"] = [{"name": name, "games": int(count)} for name, count in map_counts.head(5).items()]
+
+    all_bots = pd.concat([games_df['bot1_name'], games_df['bot2_name']], ignore_index=True).dropna()
+    bot_counts = all_bots.value_counts()
+    stats["top_bots"] = [{"name": name, "games": int(count)} for name, count in bot_counts.head(5).items()]
+
+    all_races = pd.concat([games_df['bot1_race'], games_df['bot2_race']], ignore_index=True)
+    all_races = all_races.dropna().astype(str).str.lower()
+    valid_races = all_races[~all_races.isin([''])]
+    stats["races"] = {race_name: int(count) for race_name, count in valid_races.value_counts().items()}
+
+    matchup_counts = {}
+    invalid_matchup_count = 0
+    valid_races_set = {'terran', 'protoss', 'zerg'} #, 'terran_random','protoss_random','zerg_random'}
+
+    for r1, r2 in zip(games_df['bot1_race'], games_df['bot2_race']):
+        r1 = str(r1).lower()
+        r2 = str(r2).lower()
+
+        if r1 in valid_races_set and r2 in valid_races_set:
+            matchup_key = tuple(sorted((r1, r2)))
+            matchup_counts[matchup_key] = matchup_counts.get(matchup_key, 0) + 1
+        else:
+            invalid_matchup_count += 1
+
+    sorted_matchups = sorted(matchup_counts.items(), key=lambda item: (-item[1], item[0]))
+    stats["matchups"] = [{"races": list(races), "games": count} for races, count in sorted_matchups]
+    stats["unknown_race_games"] = invalid_matchup_count
+
+    stats["ratings"] = None
+    try:
+        bot1_ratings_num = pd.to_numeric(games_df['bot1_rating'], errors='coerce')
+        bot2_ratings_num = pd.to_numeric(games_df['bot2_rating'], errors='coerce')
+        all_numeric_ratings = pd.concat([bot1_ratings_num, bot2_ratings_num], ignore_index=True)
+
+        # Isolate valid ratings for stats (drop NaN and -1 = not found)
+        valid_ratings = all_numeric_ratings.dropna()
+        valid_ratings = valid_ratings[valid_ratings != -1]
+        has_ratings = len(valid_ratings) > 0
+
+        stats["ratings"] = {
+            "average": float(valid_ratings.mean()) if has_ratings else None,
+            "min": float(valid_ratings.min()) if has_ratings else None,
+            "max": float(valid_ratings.max()) if has_ratings else None,
+            "entries_without_rating": int((all_numeric_ratings == -1).sum()),
+        }
+    except Exception as e:
+        logging.error(f"Failed processing ratings: {e}")
+
+    stats["game_time"] = None
+    try:
+        total_seconds = int(games_df['game_length'].apply(_parse_game_length).sum())
+        stats["game_time"] = {
+            "total_seconds": total_seconds,
+            "average_seconds": total_seconds / total_games if total_games else 0,
+        }
+    except Exception as e:
+        logging.error(f"Failed calculating total game time: {e}")
+
+    stats["timeframe"] = None
+    try:
+        timestamps = pd.to_datetime(games_df['timestamp'], format='%Y.%m.%d %I:%M %p', errors='coerce')
+        valid_timestamps = timestamps.dropna()
+        if not valid_timestamps.empty:
+            stats["timeframe"] = {
+                "earliest": valid_timestamps.min().strftime('%Y-%m-%d %H:%M:%S'),
+                "latest": valid_timestamps.max().strftime('%Y-%m-%d %H:%M:%S'),
+            }
+    except Exception as e:
+        logging.error(f"Failed processing timestamps: {e}")
+
+    return stats
+
+
 def show_statistics(games_df):
     print("\n=== Database Statistics ===")
 
@@ -402,135 +506,85 @@ def show_statistics(games_df):
             logging.warning(f"Column '{col}' missing in DataFrame. Statistics will be skipped.")
             return
 
-    total_games = len(games_df)
+    stats = compute_statistics(games_df)
+    total_games = stats["total_games"]
     print(f"Total Games Recorded: {total_games}")
     if total_games == 0:
         return
 
     print("\n--- Replay Status ---")
-    downloaded_count = games_df['downloaded'].sum()
-    pending_download = games_df[games_df['replay_link'].notna() & (games_df['downloaded'] == False)]
-    pending_count = len(pending_download)
-    missing_link_count = games_df['replay_link'].isna().sum()
-
-    print(f"  Replays Downloaded: {downloaded_count}")
-    print(f"  Replays Pending Download: {pending_count}")
-    if missing_link_count > 0:
-        print(f"  Games Missing Replay Link: {missing_link_count}")
+    replays = stats["replays"]
+    print(f"  Replays Downloaded: {replays['downloaded']}")
+    print(f"  Replays Pending Download: {replays['pending_download']}")
+    if replays["missing_link"] > 0:
+        print(f"  Games Missing Replay Link: {replays['missing_link']}")
 
     print("\n--- Map Popularity (Top 5) ---")
-    map_counts = games_df['map_name'].dropna().value_counts()
-    if not map_counts.empty:
-        for i, (map_name, count) in enumerate(map_counts.head(5).items()):
-            print(f"  {i+1}. {map_name}: {count} games")
+    if stats["top_maps"]:
+        for i, entry in enumerate(stats["top_maps"]):
+            print(f"  {i+1}. {entry['name']}: {entry['games']} games")
     else:
         logging.info("No map data available.")
 
     print("\n--- Most Frequent Bots (Top 5) ---")
-    all_bots = pd.concat([games_df['bot1_name'], games_df['bot2_name']], ignore_index=True).dropna()
-    bot_counts = all_bots.value_counts()
-    if not bot_counts.empty:
-        for i, (bot_name, count) in enumerate(bot_counts.head(5).items()):
-            print(f"  {i+1}. {bot_name}: {count} games")
+    if stats["top_bots"]:
+        for i, entry in enumerate(stats["top_bots"]):
+            print(f"  {i+1}. {entry['name']}: {entry['games']} games")
     else:
         logging.info("No bot data available.")
 
     print("\n--- Race Distribution ---")
-    all_races = pd.concat([games_df['bot1_race'], games_df['bot2_race']], ignore_index=True)
-    all_races = all_races.dropna().astype(str).str.lower()
-    valid_races = all_races[~all_races.isin([''])]
-    race_counts = valid_races.value_counts()
-    if not race_counts.empty:
-        for race_name, count in race_counts.items():
+    if stats["races"]:
+        for race_name, count in stats["races"].items():
             print(f"  {race_name.capitalize()}: {count} games")
     else:
         logging.info("No valid race data available.")
 
     print("\n--- Race Matchup Counts ---")
-    if 'bot1_race' in games_df.columns and 'bot2_race' in games_df.columns:
-        matchup_counts = {}
-        invalid_matchup_count = 0
-        valid_races_set = {'terran', 'protoss', 'zerg'} #, 'terran_random','protoss_random','zerg_random'}
-
-        for _, row in games_df.iterrows():
-            r1 = str(row.get('bot1_race', '')).lower()
-            r2 = str(row.get('bot2_race', '')).lower()
-
-            if r1 in valid_races_set and r2 in valid_races_set:
-                matchup_key = tuple(sorted((r1, r2)))
-                matchup_counts[matchup_key] = matchup_counts.get(matchup_key, 0) + 1
-            else:
-                invalid_matchup_count += 1
-
-        if matchup_counts:
-            sorted_matchups = sorted(matchup_counts.items(), key=lambda item: (-item[1], item[0]))
-            for (race1, race2), count in sorted_matchups:
-                print(f"  {race1.capitalize()} vs {race2.capitalize()}: {count} games")
-        else:
-            logging.info("No valid race matchup data available.")
-
-        if invalid_matchup_count > 0:
-            print(f"  Games with Random / Unknown Race(s): {invalid_matchup_count}")
-
+    if stats["matchups"]:
+        for entry in stats["matchups"]:
+            race1, race2 = entry["races"]
+            print(f"  {race1.capitalize()} vs {race2.capitalize()}: {entry['games']} games")
     else:
-        logging.info("Skipping Race Matchup Counts (missing 'bot1_race' or 'bot2_race' column).")
-
-    print("\n--- Bot Ratings  ---")
-    try:
-        bot1_ratings_num = pd.to_numeric(games_df['bot1_rating'], errors='coerce')
-        bot2_ratings_num = pd.to_numeric(games_df['bot2_rating'], errors='coerce')
-        all_numeric_ratings = pd.concat([bot1_ratings_num, bot2_ratings_num], ignore_index=True)
+        logging.info("No valid race matchup data available.")
 
-        # Count '-1' entries (before dropping NaNs)
-        minus_one_count = (all_numeric_ratings == -1).sum()
+    if stats["unknown_race_games"] > 0:
+        print(f"  Games with Random / Unknown Race(s): {stats['unknown_race_games']}")
 
-        # Isolate valid ratings for stats (drop NaN and -1)
-        valid_ratings = all_numeric_ratings.dropna()
-        valid_ratings = valid_ratings[valid_ratings != -1]
-        valid_ratings_count = len(valid_ratings)
-
-        if valid_ratings_count > 0:
-            print(f"  Average Rating: {valid_ratings.mean():.0f}")
-            print(f"  Min Rating:     {valid_ratings.min():.0f}")
-            print(f"  Max Rating:     {valid_ratings.max():.0f}")
+    print("\n--- Bot Ratings  ---")
+    ratings = stats["ratings"]
+    if ratings is not None:
+        if ratings["average"] is not None:
+            print(f"  Average Rating: {ratings['average']:.0f}")
+            print(f"  Min Rating:     {ratings['min']:.0f}")
+            print(f"  Max Rating:     {ratings['max']:.0f}")
         else:
             logging.info("No valid numeric rating data found for statistics.")
 
         # Display count of '-1' (not found) entries
-        print(f"  (Entries without rating: {minus_one_count})")
-
-    except Exception as e:
-        logging.error(f"Failed processing ratings: {e}")
+        print(f"  (Entries without rating: {ratings['entries_without_rating']})")
 
-    try:
-        total_seconds = games_df['game_length'].apply(_parse_game_length).sum()
+    game_time = stats["game_time"]
+    if game_time is not None:
+        total_seconds = game_time["total_seconds"]
         if total_seconds > 0:
             hours, rem = divmod(total_seconds, 3600)
             minutes, seconds = divmod(rem, 60)
-            avg_seconds = total_seconds / total_games
-            avg_min, avg_sec = divmod(int(avg_seconds), 60)
+            avg_min, avg_sec = divmod(int(game_time["average_seconds"]), 60)
 
             print("\n--- Total Game Time ---")
             print(f"  Combined play‑time: {hours}h {minutes}m {seconds}s")
             print(f"  Average per game : {avg_min}m {avg_sec}s")
         else:
             logging.info("No valid game‑length data to summarise.")
-    except Exception as e:
-        logging.error(f"Failed calculating total game time: {e}")
 
     print("\n--- Game Timeframe ---")
-    try:
-        timestamps = pd.to_datetime(games_df['timestamp'], format='%Y.%m.%d %I:%M %p', errors='coerce')
-        valid_timestamps = timestamps.dropna()
-        if not valid_timestamps.empty:
-            first_game_time = valid_timestamps.min()
-            last_game_time = valid_timestamps.max()
-            print(f"  Earliest Game Timestamp: {first_game_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"  Latest Game Timestamp:   {last_game_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            logging.info("Could not determine timeframe (no valid timestamps found).")
-    except Exception as e:
-        logging.error(f"Failed processing timestamps: {e}")
+    timeframe = stats["timeframe"]
+    if timeframe is not None:
+        print(f"  Earliest Game Timestamp: {timeframe['earliest']}")
+        print(f"  Latest Game Timestamp:   {timeframe['latest']}")
+    else:
+        logging.info("Could not determine timeframe (no valid timestamps found).")
 
     print("=" * 27)
 
@@ -598,6 +652,415 @@ def sync_replay_status(games_df, replay_folder_path=REPLAY_FOLDER):
     return games_df
 
 
+# Convert numpy scalars (int64, bool_, ...) to plain Python values for json.dumps
+def _json_default(obj):
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Turn DataFrame rows into JSON-ready dicts (NaN -> None)
+def _records(rows):
+    return rows.astype(object).where(rows.notna(), None).to_dict(orient="records")
+
+
+# Number of recent games to return, None if the 'limit' query parameter is invalid
+def _parse_limit(params, default=20):
+    try:
+        return max(0, int(params.get("limit", [default])[0]))
+    except ValueError:
+        return None
+
+
+# In-memory, indexed view of the games CSV used by the query server.
+# The CSV is only ever read here; rows appended to the end of the file are
+# parsed incrementally, any other change triggers a full reload.
+class GamesIndex:
+    def __init__(self, csv_path=CSV_FILENAME, replay_folder=REPLAY_FOLDER):
+        self.csv_path = csv_path
+        self.replay_folder = replay_folder
+        self.version = 0
+        self.games_df = create_empty_dataframe()
+
+        self._by_id = {}
+        self._by_bot = {}
+        self._by_pair = {}
+
+        self._file_signature = None  # (size, mtime) of the last file we read
+        self._offset = 0             # bytes of complete lines already parsed
+        self._prefix_digest = None   # hash of those bytes
+        self._cache = {}
+        self._lock = threading.RLock()
+
+        self.refresh()
+
+    # (size, mtime) of the CSV, or None if it can't be read
+    def _stat_signature(self):
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def refresh(self):
+        with self._lock:
+            signature = self._stat_signature()
+            if signature is None:
+                if self._file_signature is not None:
+                    logging.warning(f"Games database {self.csv_path} disappeared, serving empty data.")
+                    self._reset(create_empty_dataframe())
+                    self._file_signature = None
+                    self._offset = 0
+                    self._prefix_digest = None
+                    self._bump_version()
+                return self.version
+
+            if signature == self._file_signature:
+                return self.version
+
+            with open(self.csv_path, "rb") as f:
+                content = f.read()
+
+            # An unterminated last line is only held back while the file is still being written
+            end = len(content)
+            if not content.endswith(b"\n") and self._stat_signature() != signature:
+                end = content.rfind(b"\n") + 1
+
+            # Appended bytes are parsed without a header, so the prefix we already
+            # parsed must have contained it (the CSV is briefly empty while rewritten)
+            # and ended on a complete line
+            prefix_unchanged = (
+                self._prefix_digest is not None
+                and self._offset > 0
+                and content[self._offset - 1:self._offset] == b"\n"
+                and self.games_df.columns.tolist() == create_empty_dataframe().columns.tolist()
+                and end >= self._offset
+                and hashlib.blake2b(content[:self._offset]).digest() == self._prefix_digest
+            )
+
+            if prefix_unchanged:
+                if end > self._offset:
+                    added = self._append_rows(content[self._offset:end])
+                    logging.info(f"Query index: appended {added} new game(s) from {self.csv_path}.")
+                    self._bump_version()
+            else:
+                self._load_full(content[:end])
+                logging.info(f"Query index: loaded {len(self.games_df)} games from {self.csv_path}.")
+                self._bump_version()
+
+            self._offset = end
+            self._prefix_digest = hashlib.blake2b(content[:end]).digest()
+            self._file_signature = signature
+            return self.version
+
+    def get_response(self, request_path):
+        # Cache hits only need a stat of the CSV and skip the lock, so they never
+        # wait behind a reload. Misses (and reloads) are served one at a time.
+        if self._stat_signature() == self._file_signature:
+            cached = self._cache.get((self.version, request_path))
+            if cached is not None:
+                return cached
+
+        with self._lock:
+            version = self.refresh()
+            cached = self._cache.get((version, request_path))
+            if cached is not None:
+                return cached
+
+            status, payload = self._dispatch(request_path)
+            payload["data_version"] = version
+            response = (status, json.dumps(payload, default=_json_default).encode("utf-8"))
+
+            if len(self._cache) >= QUERY_CACHE_MAX_ENTRIES:
+                self._cache.clear()
+            self._cache[(version, request_path)] = response
+            return response
+
+    def _bump_version(self):
+        self.version += 1
+        self._cache.clear()
+
+    def _load_full(self, data):
+        if data.strip():
+            df = pd.read_csv(io.BytesIO(data))
+        else:
+            df = create_empty_dataframe()
+        self._reset(df)
+
+    def _append_rows(self, data):
+        new_df = pd.read_csv(io.BytesIO(data), header=None, names=self.games_df.columns.tolist())
+        start = len(self.games_df)
+        self.games_df = pd.concat([self.games_df, new_df], ignore_index=True)
+        self._index_rows(start)
+        return len(new_df)
+
+    def _reset(self, df):
+        self.games_df = df.reset_index(drop=True)
+        self._by_id = {}
+        self._by_bot = {}
+        self._by_pair = {}
+        self._index_rows(0)
+
+    # Index rows [start:] by game_id, by bot name and by (sorted) bot pair
+    def _index_rows(self, start):
+        df = self.games_df
+        game_ids = pd.to_numeric(df["game_id"].iloc[start:], errors="coerce")
+        bot1_names = df["bot1_name"].iloc[start:]
+        bot2_names = df["bot2_name"].iloc[start:]
+
+        for pos, game_id, bot1, bot2 in zip(range(start, len(df)), game_ids, bot1_names, bot2_names):
+            if pd.notna(game_id):
+                self._by_id[int(game_id)] = pos
+            for name in (bot1, bot2):
+                if pd.notna(name):
+                    self._by_bot.setdefault(name, []).append(pos)
+            if pd.notna(bot1) and pd.notna(bot2):
+                self._by_pair.setdefault(tuple(sorted((bot1, bot2))), []).append(pos)
+
+    def _dispatch(self, request_path):
+        parsed = urlparse(request_path)
+        parts = [unquote(part) for part in parsed.path.split("/") if part]
+        params = parse_qs(parsed.query)
+
+        if parts == ["stats"]:
+            return 200, self._stats()
+        if parts == ["bots"]:
+            return 200, self._bot_list()
+        if len(parts) == 2 and parts[0] == "bots":
+            limit = _parse_limit(params)
+            if limit is None:
+                return 400, {"error": "'limit' must be an integer"}
+            return self._bot_summary(parts[1], limit)
+        if parts == ["head-to-head"]:
+            bot1 = params.get("bot1", [None])[0]
+            bot2 = params.get("bot2", [None])[0]
+            if not bot1 or not bot2:
+                return 400, {"error": "Both 'bot1' and 'bot2' query parameters are required"}
+            limit = _parse_limit(params)
+            if limit is None:
+                return 400, {"error": "'limit' must be an integer"}
+            return self._head_to_head(bot1, bot2, limit)
+        if len(parts) == 2 and parts[0] == "replays":
+            return self._replay_info(parts[1])
+
+        return 404, {
+            "error": f"Unknown endpoint: {parsed.path}",
+            "endpoints": ["/stats", "/bots", "/bots/<name>", "/head-to-head?bot1=<name>&bot2=<name>",
+                          "/replays/<game_id>"],
+        }
+
+    def _stats(self):
+        return compute_statistics(self.games_df)
+
+    def _bot_list(self):
+        bots = sorted(self._by_bot.items(), key=lambda item: (-len(item[1]), item[0]))
+        return {"bots": [{"name": name, "games": len(positions)} for name, positions in bots]}
+
+    def _bot_summary(self, bot_name, limit):
+        positions = self._by_bot.get(bot_name)
+        if not positions:
+            return 404, {"error": f"Unknown bot: {bot_name}"}
+
+        rows = self.games_df.iloc[positions]
+        as_bot1 = rows["bot1_name"] == bot_name
+        results = rows["bot1_result"].where(as_bot1, rows["bot2_result"])
+        races = rows["bot1_race"].where(as_bot1, rows["bot2_race"]).dropna().astype(str)
+        opponents = rows["bot2_name"].where(as_bot1, rows["bot1_name"])
+
+        wins = int((results == "Win").sum())
+        losses = int((results == "Loss").sum())
+        latest = _records(rows.iloc[[-1]])[0]
+        latest_is_bot1 = latest["bot1_name"] == bot_name
+
+        return 200, {
+            "name": bot_name,
+            "games": len(rows),
+            "wins": wins,
+            "losses": losses,
+            "win_rate": wins / (wins + losses) if wins + losses else None,
+            "races": sorted(set(races[races != ""])),
+            "latest_rank": latest["bot1_rank"] if latest_is_bot1 else latest["bot2_rank"],
+            "latest_rating": latest["bot1_rating"] if latest_is_bot1 else latest["bot2_rating"],
+            "top_opponents": [{"name": name, "games": count}
+                              for name, count in opponents.dropna().value_counts().head(5).items()],
+            "recent_games": _records(rows.iloc[::-1].head(limit)),
+        }
+
+    def _head_to_head(self, bot1, bot2, limit):
+        positions = self._by_pair.get(tuple(sorted((bot1, bot2))), [])
+        rows = self.games_df.iloc[positions]
+
+        def wins_for(name):
+            return int((((rows["bot1_name"] == name) & (rows["bot1_result"] == "Win")) |
+                        ((rows["bot2_name"] == name) & (rows["bot2_result"] == "Win"))).sum())
+
+        return 200, {
+            "bot1": bot1,
+            "bot2": bot2,
+            "games": len(rows),
+            "wins": {bot1: wins_for(bot1), bot2: wins_for(bot2)},
+            "recent_games": _records(rows.iloc[::-1].head(limit)),
+        }
+
+    def _replay_info(self, game_id):
+        try:
+            game_id = int(game_id)
+        except ValueError:
+            return 400, {"error": f"Invalid game_id: {game_id}"}
+
+        pos = self._by_id.get(game_id)
+        if pos is None:
+            return 404, {"error": f"Unknown game_id: {game_id}"}
+
+        game = self.games_df.iloc[pos]
+        replay_path = os.path.join(self.replay_folder, f"{game_id}.rep")
+        return 200, {
+            "game_id": game_id,
+            "replay_link": game["replay_link"] if pd.notna(game["replay_link"]) else None,
+            "downloaded": bool(game["downloaded"] == True),
+            "replay_path": os.path.abspath(replay_path) if os.path.isfile(replay_path) else None,
+        }
+
+
+class _QueryRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        try:
+            status, body = self.server.games_index.get_response(self.path)
+        except Exception as e:
+            logging.exception(f"Query server failed to answer {self.path}: {e}")
+            status, body = 500, json.dumps({"error": "Internal server error"}).encode("utf-8")
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Keep per-request access lines out of the daily log
+    def log_message(self, format, *args):
+        logging.debug(f"Query server: {self.address_string()} - {format % args}")
+
+
+def run_query_server(host=QUERY_SERVER_HOST, port=QUERY_SERVER_PORT):
+    try:
+        games_index = GamesIndex(CSV_FILENAME, REPLAY_FOLDER)
+    except Exception as e:
+        logging.error(f"Failed to load {CSV_FILENAME} for the query server: {e}")
+        return
+
+    try:
+        server = ThreadingHTTPServer((host, port), _QueryRequestHandler)
+    except OSError as e:
+        logging.error(f"Could not start query server on {host}:{port}: {e}")
+        return
+    server.daemon_threads = True
+    server.games_index = games_index
+
+    logging.info(f"Query server listening on http://{host}:{server.server_port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Stopping query server...")
+    finally:
+        server.server_close()
+
+
+_NO_FALLBACK = object()
+
+
+# Runs a small dependency graph of steps, executing independent steps
+# concurrently on threads. A failed step only holds back the steps that
+# depend on it, unless it has a fallback result to hand to them instead.
+class StepScheduler:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.results = {}
+        self.status = {}     # name -> "success" | "fallback" | "failed" | "skipped"
+        self.durations = {}  # name -> seconds
+        self._steps = {}     # name -> (func, deps, fallback), in insertion order
+
+    # Steps receive the results of their dependencies as positional arguments, in order
+    def add_step(self, name, func, deps=(), fallback=_NO_FALLBACK):
+        if name in self._steps:
+            raise ValueError(f"Step '{name}' is already scheduled")
+        for dep in deps:
+            if dep not in self._steps:
+                raise ValueError(f"Step '{name}' depends on unknown step '{dep}'")
+        self._steps[name] = (func, tuple(deps), fallback)
+
+    def _run_step(self, name, func, args):
+        step_start = time.time()
+        try:
+            return func(*args)
+        finally:
+            self.durations[name] = time.time() - step_start
+
+    def run(self):
+        pending = dict(self._steps)
+        running = {}  # future -> step name
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                # Dependencies are always added first, so one pass in order settles chains of skips
+                for name, (func, deps, fallback) in list(pending.items()):
+                    if any(dep not in self.status for dep in deps):
+                        continue
+                    del pending[name]
+
+                    missing = [dep for dep in deps if dep not in self.results]
+                    if missing:
+                        logging.warning(f"Skipping step '{name}': {', '.join(missing)} did not complete.")
+                        self.status[name] = "skipped"
+                        self.durations[name] = 0.0
+                        continue
+
+                    logging.info(f"Starting step '{name}'...")
+                    args = [self.results[dep] for dep in deps]
+                    running[executor.submit(self._run_step, name, func, args)] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                        self.status[name] = "success"
+                        logging.info(f"Step '{name}' finished in {self.durations[name]:.2f} seconds.")
+                    except Exception as e:
+                        self.status[name] = "failed"
+                        logging.exception(f"Step '{name}' failed after {self.durations[name]:.2f} seconds: {e}")
+                        fallback = self._steps[name][2]
+                        if fallback is not _NO_FALLBACK:
+                            logging.warning(f"Continuing with fallback result for step '{name}'.")
+                            self.status[name] = "fallback"
+                            self.results[name] = fallback
+
+        # A step that fell back was handled, it doesn't fail the run
+        return all(status in ("success", "fallback") for status in self.status.values())
+
+    # Longest chain of dependent steps by measured duration
+    def critical_path(self):
+        path_cost = {}
+        previous = {}
+        for name, (_, deps, _) in self._steps.items():
+            slowest_dep = max(deps, key=lambda dep: path_cost[dep], default=None)
+            path_cost[name] = self.durations.get(name, 0.0) + (path_cost[slowest_dep] if slowest_dep else 0.0)
+            previous[name] = slowest_dep
+
+        if not path_cost:
+            return [], 0.0
+
+        last = max(path_cost, key=path_cost.get)
+        path = []
+        node = last
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return path[::-1], path_cost[last]
+
+
 def run_automated_task(download=False):
     start_time = time.time()
     logging.info("=" * 30)
@@ -605,33 +1068,34 @@ def run_automated_task(download=False):
     logging.info(f"Download replays: {'Enabled' if download else 'Disabled'}")
     logging.info("=" * 30)
     success = False  # Flag to track outcome
+    scheduler = StepScheduler()
 
     try:
-        logging.info("Step 1: Loading existing game data...")
-        games_df = load_existing_games()
+        # Fetching ratings runs alongside loading (and syncing) the games data and
+        # starting Chrome. Chrome waits for the quick local steps, so a job that
+        # can't save its results never launches a browser or scrapes the ladder.
+        scheduler.add_step("load_games", load_existing_games)
+        scheduler.add_step("fetch_ratings", get_all_bot_ratings, fallback={})
 
+        games_step = "load_games"
         if download:
-            logging.info("Step 2: Syncing replay status with folder...")
-            games_df = sync_replay_status(games_df, REPLAY_FOLDER)
+            scheduler.add_step("sync_replays", lambda games_df: sync_replay_status(games_df, REPLAY_FOLDER),
+                               deps=("load_games",))
+            games_step = "sync_replays"
         else:
-            logging.info("Step 2: Skipping syncing replay status.")
-
-        logging.info("Step 3: Fetching bot ratings...")
-        bot_ratings = get_all_bot_ratings()
+            logging.info("Skipping syncing replay status.")
 
-        logging.info("Step 4: Extracting new games from BASIL ladder...")
-        new_games = extract_basil_ladder_games(bot_ratings)
-
-        logging.info("Step 5: Updating games database with new games...")
-        games_df = update_games_database(new_games, games_df)
+        scheduler.add_step("start_browser", lambda games_df: start_chrome_driver(), deps=(games_step,))
+        scheduler.add_step("scrape_games", extract_basil_ladder_games, deps=("fetch_ratings", "start_browser"))
+        scheduler.add_step("update_database", lambda games_df, new_games: update_games_database(new_games, games_df),
+                           deps=(games_step, "scrape_games"))
 
         if download:
-            logging.info("Step 6: Downloading new replays...")
-            games_df = download_replays(games_df)
+            scheduler.add_step("download_replays", download_replays, deps=("update_database",))
         else:
-            logging.info("Step 6: Skipping replay download.")
+            logging.info("Skipping replay download.")
 
-        success = True
+        success = scheduler.run()
 
     except Exception as e:
         logging.exception("!!! An critical error occurred during the daily scrape job, halting execution !!!")
@@ -639,9 +1103,14 @@ def run_automated_task(download=False):
     finally:
         end_time = time.time()
         duration = end_time - start_time
+        critical_path, critical_duration = scheduler.critical_path()
         logging.info("="*30)
         logging.info(f"Automated Scrape Task Finished")
         logging.info(f"Outcome: {'SUCCESS' if success else 'FAILURE'}")
+        for name, status in scheduler.status.items():
+            logging.info(f"  {name}: {status.upper()} ({scheduler.durations.get(name, 0.0):.2f}s)")
+        if critical_path:
+            logging.info(f"Critical Path: {' -> '.join(critical_path)} ({critical_duration:.2f} seconds)")
         logging.info(f"Total Duration: {duration:.2f} seconds")
         logging.info("="*30)
 
@@ -660,9 +1129,10 @@ def main():
         print("1. Show current database statistics")
         print("2. Fetch NEW games from BASIL Ladder (and download new replays)")
         print("3. Download pending replays")
-        print("4. Exit")
+        print("4. Start local query server")
+        print("5. Exit")
 
-        choice = input("\nEnter your choice (1-4): ")
+        choice = input("\nEnter your choice (1-5): ")
 
         if choice == '1':
             show_statistics(games_df)
@@ -684,6 +1154,11 @@ def main():
             print("--- Replay Download Finished ---")
 
         elif choice == '4':
+            print("--- Starting Query Server ---")
+            run_query_server()
+            print("--- Query Server Stopped ---")
+
+        elif choice == '5':
             print("\nExiting program. Goodbye!")
             break
 
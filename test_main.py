@@ -0,0 +1,293 @@
+import json
+import threading
+import time
+
+import pytest
+
+import main
+
+
+def _game(game_id, bot1_name, bot2_name):
+    return {
+        "game_id": game_id, "bot1_name": bot1_name, "bot1_rank": "S", "bot1_rating": 2000,
+        "bot1_race": "terran", "bot1_result": "Win",
+        "bot2_name": bot2_name, "bot2_rank": "A", "bot2_rating": -1,
+        "bot2_race": "zerg", "bot2_result": "Loss",
+        "map_name": "Fighting Spirit", "game_length": "8m 16s", "timestamp": "2025.05.24 08:10 PM",
+        "date_scraped": "2025-05-24 20:10:41", "replay_link": None, "downloaded": False,
+    }
+
+
+def _write_games(csv_path, games):
+    df = main.create_empty_dataframe()
+    if games:
+        df = main.pd.DataFrame(games, columns=df.columns)
+    df.to_csv(csv_path, index=False)
+
+
+def _get(index, path):
+    status, body = index.get_response(path)
+    return status, json.loads(body)
+
+
+def _make_index(tmp_path, games):
+    csv_path = tmp_path / "games.csv"
+    _write_games(csv_path, games)
+    return csv_path, main.GamesIndex(str(csv_path), str(tmp_path / "replays"))
+
+
+def test_games_index_appends_new_rows(tmp_path):
+    csv_path, index = _make_index(tmp_path, [_game(1, "BotA", "BotB")])
+    assert _get(index, "/stats")[1]["data_version"] == 1
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("2,BotC,S,2100,protoss,Win,BotA,S,2000,terran,Loss,Fighting Spirit,9m 1s,"
+                "2025.05.24 09:10 PM,2025-05-24 21:10:41,,False\n")
+
+    status, stats = _get(index, "/stats")
+    assert status == 200
+    assert stats["total_games"] == 2
+    assert stats["data_version"] == 2
+    assert _get(index, "/bots")[1]["bots"] == [
+        {"name": "BotA", "games": 2}, {"name": "BotB", "games": 1}, {"name": "BotC", "games": 1},
+    ]
+    h2h = _get(index, "/head-to-head?bot1=BotA&bot2=BotC")[1]
+    assert h2h["games"] == 1
+    assert [game["game_id"] for game in h2h["recent_games"]] == [2]
+
+
+def test_games_index_reloads_after_truncated_rewrite(tmp_path):
+    csv_path, index = _make_index(tmp_path, [_game(1, "BotA", "BotB")])
+
+    # to_csv truncates the file before writing, a query can land in between
+    csv_path.write_bytes(b"")
+    assert _get(index, "/bots")[1]["bots"] == []
+
+    _write_games(csv_path, [_game(1, "BotA", "BotB"), _game(2, "BotC", "BotA")])
+
+    assert _get(index, "/bots")[1]["bots"] == [
+        {"name": "BotA", "games": 2}, {"name": "BotB", "games": 1}, {"name": "BotC", "games": 1},
+    ]
+    assert _get(index, "/replays/1")[0] == 200
+    assert _get(index, "/stats")[1]["total_games"] == 2
+
+
+def test_games_index_bot_summary(tmp_path):
+    games = [_game(1, "BotA", "BotB"), _game(2, "BotB", "BotA"), _game(3, "BotA", "BotC")]
+    games[2]["bot1_rating"] = 2050
+    _, index = _make_index(tmp_path, games)
+
+    status, bot = _get(index, "/bots/BotA?limit=2")
+    assert status == 200
+    assert bot["name"] == "BotA"
+    assert (bot["games"], bot["wins"], bot["losses"]) == (3, 2, 1)
+    assert bot["win_rate"] == 2 / 3
+    assert bot["races"] == ["terran", "zerg"]
+    assert (bot["latest_rank"], bot["latest_rating"]) == ("S", 2050)
+    assert bot["top_opponents"] == [{"name": "BotB", "games": 2}, {"name": "BotC", "games": 1}]
+    assert [game["game_id"] for game in bot["recent_games"]] == [3, 2]
+    assert bot["recent_games"][0]["replay_link"] is None
+
+
+def test_games_index_head_to_head(tmp_path):
+    _, index = _make_index(tmp_path, [_game(1, "BotA", "BotB"), _game(2, "BotB", "BotA"),
+                                      _game(3, "BotA", "BotB")])
+
+    status, h2h = _get(index, "/head-to-head?bot1=BotB&bot2=BotA")
+    assert status == 200
+    assert h2h["games"] == 3
+    assert h2h["wins"] == {"BotB": 1, "BotA": 2}
+    assert [game["game_id"] for game in h2h["recent_games"]] == [3, 2, 1]
+
+    assert _get(index, "/head-to-head?bot1=BotA&bot2=BotZ")[1]["games"] == 0
+    assert _get(index, "/head-to-head?bot1=BotA")[0] == 400
+
+
+def test_games_index_replay_info(tmp_path):
+    games = [_game(1, "BotA", "BotB"), _game(2, "BotA", "BotB")]
+    games[1].update(replay_link="https://example.org/2.rep", downloaded=True)
+    _, index = _make_index(tmp_path, games)
+    (tmp_path / "replays").mkdir()
+    (tmp_path / "replays" / "2.rep").write_bytes(b"rep")
+
+    status, replay = _get(index, "/replays/2")
+    assert status == 200
+    assert replay == {
+        "game_id": 2,
+        "replay_link": "https://example.org/2.rep",
+        "downloaded": True,
+        "replay_path": str(tmp_path / "replays" / "2.rep"),
+        "data_version": 1,
+    }
+    assert _get(index, "/replays/1")[1]["replay_path"] is None
+
+
+def test_games_index_error_responses(tmp_path):
+    _, index = _make_index(tmp_path, [_game(1, "BotA", "BotB")])
+
+    assert _get(index, "/bots/Nobody")[0] == 404
+    assert _get(index, "/replays/99")[0] == 404
+    assert _get(index, "/replays/abc")[0] == 400
+    status, body = _get(index, "/nope")
+    assert status == 404
+    assert "/stats" in body["endpoints"]
+
+
+def test_games_index_keeps_unterminated_last_row(tmp_path):
+    csv_path = tmp_path / "games.csv"
+    _write_games(csv_path, [_game(1, "BotA", "BotB")])
+    csv_path.write_bytes(csv_path.read_bytes().rstrip(b"\n"))
+    index = main.GamesIndex(str(csv_path), str(tmp_path / "replays"))
+
+    status, body = index.get_response("/bots/BotA")
+    assert status == 200
+    assert json.loads(body)["games"] == 1
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write("\n2,BotC,S,2100,protoss,Win,BotA,S,1990,terran,Loss,Fighting Spirit,9m 1s,"
+                "2025.05.24 09:10 PM,2025-05-24 21:10:41,,False\n")
+
+    bot = json.loads(index.get_response("/bots/BotA")[1])
+    assert bot["games"] == 2
+    assert bot["latest_rating"] == 1990
+
+
+def test_games_index_cache_hit_skips_lock(tmp_path):
+    csv_path = tmp_path / "games.csv"
+    _write_games(csv_path, [_game(1, "BotA", "BotB")])
+    index = main.GamesIndex(str(csv_path), str(tmp_path / "replays"))
+    first = index.get_response("/bots/BotA")
+
+    holding = threading.Event()
+    release = threading.Event()
+
+    def hold_lock():
+        with index._lock:
+            holding.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    holding.wait(5)
+    try:
+        assert index.get_response("/bots/BotA") is first
+    finally:
+        release.set()
+        holder.join()
+
+
+def test_games_index_limit_only_checked_where_used(tmp_path):
+    csv_path = tmp_path / "games.csv"
+    _write_games(csv_path, [_game(1, "BotA", "BotB")])
+    index = main.GamesIndex(str(csv_path), str(tmp_path / "replays"))
+
+    assert index.get_response("/stats?limit=x")[0] == 200
+    assert index.get_response("/replays/1?limit=x")[0] == 200
+    assert index.get_response("/bots/BotA?limit=x")[0] == 400
+    assert index.get_response("/head-to-head?bot1=BotA&bot2=BotB&limit=x")[0] == 400
+
+
+def _fail():
+    raise RuntimeError("boom")
+
+
+def test_step_scheduler_fallback_reaches_dependents():
+    scheduler = main.StepScheduler()
+    scheduler.add_step("ratings", _fail, fallback={})
+    scheduler.add_step("scrape", lambda ratings: ("scraped", ratings), deps=("ratings",))
+
+    assert scheduler.run() is True
+    assert scheduler.status == {"ratings": "fallback", "scrape": "success"}
+    assert scheduler.results["scrape"] == ("scraped", {})
+
+
+def test_run_automated_task_skips_browser_when_load_fails(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "load_existing_games", _fail)
+    monkeypatch.setattr(main, "get_all_bot_ratings", lambda: {})
+    monkeypatch.setattr(main, "start_chrome_driver", lambda: calls.append("start_browser"))
+    monkeypatch.setattr(main, "extract_basil_ladder_games", lambda ratings, driver: calls.append("scrape"))
+
+    main.run_automated_task(download=False)
+
+    assert calls == []
+
+
+def test_step_scheduler_failure_skips_only_dependents():
+    scheduler = main.StepScheduler()
+    scheduler.add_step("load", _fail)
+    scheduler.add_step("ratings", lambda: {"BotA": 2000})
+    scheduler.add_step("update", lambda games: games, deps=("load",))
+    scheduler.add_step("scrape", lambda ratings: ["game"], deps=("ratings",))
+
+    assert scheduler.run() is False
+    assert scheduler.status == {"load": "failed", "update": "skipped", "ratings": "success", "scrape": "success"}
+    assert scheduler.results["scrape"] == ["game"]
+    assert "update" not in scheduler.results
+
+
+def test_step_scheduler_chain_of_skips_settles():
+    scheduler = main.StepScheduler()
+    scheduler.add_step("root", _fail)
+    scheduler.add_step("a", lambda root: root, deps=("root",))
+    scheduler.add_step("b", lambda a: a, deps=("a",))
+    scheduler.add_step("c", lambda root, b: b, deps=("root", "b"))
+
+    runner = threading.Thread(target=scheduler.run, daemon=True)
+    runner.start()
+    runner.join(5)
+
+    assert not runner.is_alive()
+    assert scheduler.status == {"root": "failed", "a": "skipped", "b": "skipped", "c": "skipped"}
+
+
+def test_step_scheduler_rejects_unknown_and_duplicate_steps():
+    scheduler = main.StepScheduler()
+    scheduler.add_step("load", lambda: None)
+
+    with pytest.raises(ValueError):
+        scheduler.add_step("update", lambda games: games, deps=("missing",))
+    with pytest.raises(ValueError):
+        scheduler.add_step("load", lambda: None)
+
+
+def test_step_scheduler_critical_path_is_slowest_chain():
+    def sleep(seconds):
+        return lambda *args: time.sleep(seconds)
+
+    scheduler = main.StepScheduler()
+    scheduler.add_step("load", sleep(0.1))
+    scheduler.add_step("ratings", sleep(0.12))
+    scheduler.add_step("update", sleep(0.1), deps=("load",))
+    scheduler.run()
+
+    path, duration = scheduler.critical_path()
+    assert path == ["load", "update"]
+    assert duration >= 0.2
+
+
+def test_run_automated_task_wires_steps(monkeypatch):
+    games_df = main.create_empty_dataframe()
+    driver = object()
+    new_games = [_game(1, "BotA", "BotB")]
+    calls = {}
+
+    def extract(ratings, scrape_driver):
+        calls["extract"] = (ratings, scrape_driver)
+        return new_games
+
+    def update(games, existing_df):
+        calls["update"] = (games, existing_df)
+        return existing_df
+
+    monkeypatch.setattr(main, "load_existing_games", lambda: games_df)
+    monkeypatch.setattr(main, "get_all_bot_ratings", _fail)
+    monkeypatch.setattr(main, "start_chrome_driver", lambda: driver)
+    monkeypatch.setattr(main, "extract_basil_ladder_games", extract)
+    monkeypatch.setattr(main, "update_games_database", update)
+
+    main.run_automated_task(download=False)
+
+    assert calls["extract"] == ({}, driver)
+    assert calls["update"][0] is new_games
+    assert calls["update"][1] is games_df